@@ -4,6 +4,7 @@ Processing Status Component
 Shows real-time progress during workflow execution.
 """
 
+import hashlib
 import sys
 import time
 from pathlib import Path
@@ -13,6 +14,7 @@ import streamlit as st
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from app.utils.state_manager import get_state, set_state
+from config.settings import settings
 
 
 def render_processing_status():
@@ -37,6 +39,18 @@ def render_processing_status():
         st.info("No processing in progress")
 
 
+def purge_old_uploads(upload_dir: Path):
+    """Delete uploaded resumes not used within UPLOAD_RETENTION_HOURS"""
+    cutoff = time.time() - settings.UPLOAD_RETENTION_HOURS * 3600
+
+    for upload in upload_dir.iterdir():
+        try:
+            if upload.is_file() and upload.stat().st_mtime < cutoff:
+                upload.unlink()
+        except OSError:
+            pass  # Removed concurrently or not deletable; retry next run
+
+
 def run_workflow():
     """Run the screening workflow"""
 
@@ -52,18 +66,31 @@ def run_workflow():
         set_state("workflow_state", "error")
         return
 
-    # Prepare data
-    resumes = []
+    # Prepare data: store uploads on disk so the workflow reads them lazily
+    upload_dir = Path(settings.CACHE_DIR).resolve() / "uploads"
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    purge_old_uploads(upload_dir)
+
+    resume_paths = []
     filenames = []
 
     for resume_file in resume_files:
-        resumes.append(resume_file.read())
+        data = resume_file.read()
+        # Content-addressed, so re-uploads map to the same path
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        resume_path = upload_dir / f"{digest}_{Path(resume_file.name).name}"
+        if resume_path.exists():
+            resume_path.touch()  # Restart its retention period
+        else:
+            resume_path.write_bytes(data)
+
+        resume_paths.append(str(resume_path))
         filenames.append(resume_file.name)
 
     # Create initial state
     initial_state = {
         "job_description": job_description,
-        "resumes": resumes,
+        "resume_paths": resume_paths,
         "resume_filenames": filenames,
         "candidates": [],
         "errors": [],
@@ -109,9 +136,12 @@ def run_workflow():
         status_text.text("🤖 Initializing AI agent...")
 
         if "Enhanced" in workflow_type:
-            from src.agents.graph.graph_enhanced import create_enhanced_screening_graph
+            from src.agents.graph.graph_enhanced import (
+                get_enhanced_screening_graph,
+                invoke_enhanced_screening,
+            )
 
-            app = create_enhanced_screening_graph()
+            app = get_enhanced_screening_graph()
         else:
             from src.agents.graph.graph_builder import create_screening_graph
 
@@ -128,7 +158,11 @@ def run_workflow():
             time.sleep(0.2)  # Brief delay for visual feedback
 
         # Actually run the workflow
-        result = app.invoke(initial_state)
+        if "Enhanced" in workflow_type:
+            fresh = (get_state("config") or {}).get("fresh_run", False)
+            result = invoke_enhanced_screening(app, initial_state, fresh=fresh)
+        else:
+            result = app.invoke(initial_state)
 
         # Save results
         set_state("results", result)
@@ -127,6 +127,12 @@ def render_upload_section():
             enable_ats_scoring = st.checkbox("ATS Scoring", value=True)
             enable_quality_check = st.checkbox("Quality Self-Check", value=True)
 
+        fresh_run = st.checkbox(
+            "Re-run from scratch",
+            value=False,
+            help="Ignore saved results for this job and these resumes",
+        )
+
     st.markdown("---")
 
     # Start button
@@ -160,6 +166,7 @@ def render_upload_section():
                 "enable_salary_estimation": enable_salary_estimation,
                 "enable_ats_scoring": enable_ats_scoring,
                 "enable_quality_check": enable_quality_check,
+                "fresh_run": fresh_run,
             },
         )
 
@@ -18,6 +18,16 @@ class Settings(BaseSettings):
     # Paths
     DATA_DIR: str = "data"
     OUTPUT_DIR: str = "data/outputs"
+    CACHE_DIR: str = "cache"
+
+    # Caching
+    LLM_CACHE_DB: str = "screening_cache.db"
+    LLM_CACHE_TTL_SECONDS: int = 86400  # 24h
+    CHECKPOINT_DB: str = "screening_checkpoints.db"
+
+    # Uploaded resumes (candidate PII) are kept in CACHE_DIR/uploads so
+    # checkpointed runs can resume; files unused for this long are deleted
+    UPLOAD_RETENTION_HOURS: float = 24
 
     class Config:
         env_file = ".env"
@@ -25,10 +25,12 @@ def load_job_description(job_path: str) -> str:
 
 def load_resumes(resume_paths: list) -> tuple:
     """
-    Load resume PDFs
+    Collect existing resume PDFs
+
+    The files are read lazily by the workflow, so only paths are kept here.
 
     Returns:
-        (resume_bytes_list, filenames_list)
+        (resume_path_list, filenames_list)
     """
     resumes = []
     filenames = []
@@ -39,9 +41,8 @@ def load_resumes(resume_paths: list) -> tuple:
             print(f"⚠️  Warning: {path} not found, skipping...")
             continue
 
-        with open(path, "rb") as f:
-            resumes.append(f.read())
-            filenames.append(path_obj.name)
+        resumes.append(str(path_obj.resolve()))
+        filenames.append(path_obj.name)
 
     return resumes, filenames
 
@@ -189,7 +190,7 @@ def main():
         # Create initial state
         initial_state = {
             "job_description": job_description,
-            "resumes": resumes,
+            "resume_paths": resumes,
             "resume_filenames": filenames,
             "candidates": [],
             "errors": [],
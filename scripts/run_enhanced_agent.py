@@ -7,6 +7,7 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -14,7 +15,10 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.agents.graph.graph_enhanced import create_enhanced_screening_graph
+from src.agents.graph.graph_enhanced import (
+    get_enhanced_screening_graph,
+    invoke_enhanced_screening,
+)
 
 
 def load_job_description(job_path: str) -> str:
@@ -25,10 +29,12 @@ def load_job_description(job_path: str) -> str:
 
 def load_resumes(resume_paths: list) -> tuple:
     """
-    Load resume PDFs
+    Collect existing resume PDFs
+
+    The files are read lazily by the workflow, so only paths are kept here.
 
     Returns:
-        (resume_bytes_list, filenames_list)
+        (resume_path_list, filenames_list)
     """
     resumes = []
     filenames = []
@@ -39,9 +45,8 @@ def load_resumes(resume_paths: list) -> tuple:
             print(f"Warning: {path} not found, skipping...")
             continue
 
-        with open(path, "rb") as f:
-            resumes.append(f.read())
-            filenames.append(path_obj.name)
+        resumes.append(str(path_obj.resolve()))
+        filenames.append(path_obj.name)
 
     return resumes, filenames
 
@@ -180,6 +185,12 @@ Examples:
       --job data/sample_jobs/ai_engineer.txt \\
       --resumes data/sample_resumes/candidate_1.pdf data/sample_resumes/candidate_2.pdf
 
+  # Re-run from scratch instead of reusing checkpointed results
+  python scripts/run_enhanced_agent.py \\
+      --job job.txt \\
+      --resumes resume1.pdf resume2.pdf \\
+      --fresh
+
   # Specify custom output directory
   python scripts/run_enhanced_agent.py \\
       --job job.txt \\
@@ -206,8 +217,22 @@ Examples:
         "--verbose", action="store_true", help="Show detailed execution logs"
     )
 
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore checkpointed results for these inputs and re-run everything",
+    )
+
     args = parser.parse_args()
 
+    # Workflow modules log progress instead of printing it. Third-party
+    # INFO logs (e.g. httpx's line per LLM request) only show with --verbose.
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(message)s",
+    )
+    logging.getLogger("src").setLevel(logging.INFO)
+
     # Validate inputs
     if not Path(args.job).exists():
         print(f"Error: Job description file not found: {args.job}")
@@ -240,7 +265,7 @@ Examples:
         # Create initial state
         initial_state = {
             "job_description": job_description,
-            "resumes": resumes,
+            "resume_paths": resumes,
             "resume_filenames": filenames,
             "candidates": [],
             "errors": [],
@@ -249,13 +274,13 @@ Examples:
 
         # Create and run the enhanced graph
         print("Initializing enhanced agentic workflow...\n")
-        app = create_enhanced_screening_graph()
+        app = get_enhanced_screening_graph()
 
         print("\n" + "=" * 80)
         print("EXECUTING ENHANCED WORKFLOW")
         print("=" * 80 + "\n")
 
-        result = app.invoke(initial_state)
+        result = invoke_enhanced_screening(app, initial_state, fresh=args.fresh)
 
         # Check for errors
         if result.get("errors"):
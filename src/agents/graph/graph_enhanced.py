@@ -2,62 +2,178 @@
 Enhanced Resume Screening Agent - Agentic Workflow with Tools
 """
 
-from typing import Literal
+import hashlib
+import logging
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
 
+from langgraph.checkpoint.sqlite import SqliteSaver
 from langgraph.graph import END, StateGraph
 
+from config.settings import settings
 from src.agents.nodes import (
     ats_scorer_node,
     bias_detector_node,
     candidate_enricher_node,
-    education_verifier_node,
-    experience_analyzer_enhanced_node,
+    enhanced_analysis_node,
     job_analyzer_node,
-    quality_checker_node,
     question_generator_node,
     report_generator_node,
     resume_parser_node,
     salary_estimator_node,
-    scorer_node,
     skill_matcher_enhanced_node,
     tool_coordinator_node,
 )
 from src.state.state import AgentState
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+BANNER = "=" * 80
+
+GRAPH_SUMMARY = "\n".join(
+    [
+        "",
+        BANNER,
+        "ENHANCED AGENTIC WORKFLOW STRUCTURE",
+        BANNER,
+        "",
+        "PHASE 1: Initial Analysis",
+        "  1. Job Analyzer - Extract requirements from JD",
+        "  2. Resume Parser - Parse all PDF resumes",
+        "",
+        "PHASE 2: Agentic Tool Selection & Enrichment",
+        "  3. Tool Coordinator - LLM decides which tools to use per candidate",
+        "  4. Candidate Enricher - Execute selected tools:",
+        "     • Web Search (Company Verification)",
+        "     • GitHub Analyzer (Skill Validation)",
+        "     • Skill Taxonomy (Semantic Matching)",
+        "",
+        "PHASE 3: Enhanced Analysis",
+        "  5. Skill Matcher Enhanced - Uses semantic taxonomy",
+        "  Enhanced Analysis node (steps 6-9 run as one graph node):",
+        "  6. Experience Analyzer Enhanced - Uses company data",
+        "  7. Education Verifier",
+        "  8. Scorer & Ranker",
+        "",
+        "PHASE 4: Quality Control & Self-Reflection",
+        "  9. Quality Checker - Reviews analysis confidence",
+        "     ├─→ [Low Confidence] Re-analyze flagged candidates in place (max 2)",
+        "     └─→ [High Confidence] Continue to next phase",
+        "",
+        "PHASE 5: Additional Analyses (run in parallel)",
+        "  10. Bias Detector - Flags potential hiring biases",
+        "  11. Salary Estimator - Compensation recommendations",
+        "  12. ATS Scorer - Resume optimization score",
+        "",
+        "PHASE 6: Output Generation",
+        "  13. Report Generator - Comprehensive markdown report",
+        "  14. Question Generator - Personalized interview questions",
+        "",
+        BANNER,
+        "KEY AGENTIC FEATURES:",
+        BANNER,
+        "  ✨ Tool Coordinator: LLM intelligently selects tools per candidate",
+        "  ✨ Self-Reflection: Low confidence triggers targeted re-analysis",
+        "  ✨ Semantic Understanding: Skill taxonomy for better matching",
+        "  ✨ Multi-Tool Enrichment: Web search + GitHub + taxonomy",
+        "  ✨ Quality Assurance: Confidence validation with feedback loop",
+        "  ✨ Fairness: Bias detection for ethical hiring",
+        "  ✨ Comprehensive: Salary + ATS scoring for complete assessment",
+        BANNER,
+        "",
+    ]
+)
+
+# Phase 5 analyses only read the scored candidates and write disjoint state
+# keys, so they run in parallel and join before report generation.
+ADDITIONAL_ANALYSIS_NODES = ["bias_detector", "salary_estimator", "ats_scorer"]
+
+# Part of every checkpoint thread id; bump it when node outputs change so
+# runs checkpointed by older code are not reused
+CHECKPOINT_VERSION = 1
+
 
-def should_reanalyze(state: dict) -> Literal["reanalyze", "continue"]:
+def join_additional_analyses(state: dict) -> dict:
     """
-    Conditional edge: Decide if we need to re-analyze
+    Fan-in node: Wait for all additional analyses before reporting
 
-    This is the self-reflection mechanism.
-    If quality checker determines low confidence, loop back.
+    The parallel nodes don't write current_step themselves (concurrent
+    writes to the same key would conflict), so it is set here.
     """
-    quality_check = state.get("quality_check", {})
-
-    needs_reanalysis = quality_check.get("needs_reanalysis", False)
-    reanalysis_count = state.get("reanalysis_count", 0)
-
-    # Limit reanalysis to prevent infinite loops
-    if needs_reanalysis and reanalysis_count < 2:
-        print("\n" + "=" * 80)
-        print("QUALITY CHECKER TRIGGERED RE-ANALYSIS")
-        print("=" * 80)
-        print(
-            f"Confidence was too low. Re-analyzing (attempt {reanalysis_count + 1}/2)...\n"
-        )
-        return "reanalyze"
-    else:
-        if needs_reanalysis and reanalysis_count >= 2:
-            print(
-                "\nMaximum re-analysis attempts reached. Continuing with current results.\n"
-            )
-        return "continue"
+    return {"current_step": "additional_analysis_complete"}
+
+
+def create_checkpointer() -> SqliteSaver:
+    """
+    Create the SQLite checkpointer that persists state after every node
+
+    Returns:
+        SqliteSaver backed by the screening checkpoints database
+    """
+    cache_dir = Path(settings.CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # Nodes run on worker threads, so the connection must be shareable
+    conn = sqlite3.connect(cache_dir / settings.CHECKPOINT_DB, check_same_thread=False)
+    return SqliteSaver(conn)
+
+
+def screening_thread_id(initial_state: dict) -> str:
+    """
+    Derive a stable checkpoint thread id from the screening inputs
 
+    The same job description, resumes and scoring settings always map to
+    the same thread, across processes, so a re-run picks up that run's
+    checkpoints. Changing the model, temperature or weights starts a new
+    thread.
+    """
+    digest = hashlib.sha256()
+
+    def add_field(data: bytes) -> None:
+        # Length-prefixed, so adjacent fields can't run into each other
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+
+    add_field(str(CHECKPOINT_VERSION).encode())
+    for setting in (
+        settings.MODEL_NAME,
+        settings.TEMPERATURE,
+        settings.SKILL_WEIGHT,
+        settings.EXPERIENCE_WEIGHT,
+        settings.EDUCATION_WEIGHT,
+    ):
+        add_field(str(setting).encode())
+
+    add_field(initial_state["job_description"].encode())
+
+    # Every resume is hashed; filenames are optional and may be missing
+    resume_paths = initial_state["resume_paths"]
+    filenames = initial_state.get("resume_filenames") or []
+    digest.update(len(resume_paths).to_bytes(8, "big"))
+
+    for i, resume_path in enumerate(resume_paths):
+        add_field(filenames[i].encode() if i < len(filenames) else b"")
+
+        digest.update(Path(resume_path).stat().st_size.to_bytes(8, "big"))
+        with open(resume_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+
+    return f"screening-{digest.hexdigest()[:32]}"
 
-def create_enhanced_screening_graph() -> StateGraph:
+
+def create_enhanced_screening_graph(
+    checkpointer: SqliteSaver | None = None,
+) -> StateGraph:
     """
     Create the enhanced agentic resume screening workflow
 
+    Args:
+        checkpointer: Optional checkpointer; when set, every invocation
+            needs a thread_id (see invoke_enhanced_screening)
+
     Returns:
         Compiled StateGraph ready for execution
     """
@@ -65,7 +181,7 @@ def create_enhanced_screening_graph() -> StateGraph:
     # Initialize the graph with our state schema
     workflow = StateGraph(AgentState)
 
-    print("Building enhanced agentic graph...")
+    logger.info("Building enhanced agentic graph...")
 
     workflow.add_node("job_analyzer", job_analyzer_node)
     workflow.add_node("resume_parser", resume_parser_node)
@@ -74,22 +190,21 @@ def create_enhanced_screening_graph() -> StateGraph:
     workflow.add_node("candidate_enricher", candidate_enricher_node)
 
     workflow.add_node("skill_matcher_enhanced", skill_matcher_enhanced_node)
-    workflow.add_node("experience_analyzer_enhanced", experience_analyzer_enhanced_node)
-    workflow.add_node("education_verifier", education_verifier_node)
-    workflow.add_node("scorer", scorer_node)
 
-    workflow.add_node("quality_checker", quality_checker_node)
+    # Experience -> education -> scorer -> quality checker, as one node
+    workflow.add_node("enhanced_analysis", enhanced_analysis_node)
 
     workflow.add_node("bias_detector", bias_detector_node)
     workflow.add_node("salary_estimator", salary_estimator_node)
     workflow.add_node("ats_scorer", ats_scorer_node)
+    workflow.add_node("join_phase5", join_additional_analyses)
 
     workflow.add_node("report_generator", report_generator_node)
     workflow.add_node("question_generator", question_generator_node)
 
     # DEFINE WORKFLOW EDGES
-    print("Added all nodes")
-    print("Connecting workflow edges...")
+    logger.info("Added all nodes")
+    logger.info("Connecting workflow edges...")
 
     workflow.set_entry_point("job_analyzer")
 
@@ -99,104 +214,114 @@ def create_enhanced_screening_graph() -> StateGraph:
     workflow.add_edge("tool_coordinator", "candidate_enricher")
 
     workflow.add_edge("candidate_enricher", "skill_matcher_enhanced")
-    workflow.add_edge("skill_matcher_enhanced", "experience_analyzer_enhanced")
-    workflow.add_edge("experience_analyzer_enhanced", "education_verifier")
-    workflow.add_edge("education_verifier", "scorer")
+    workflow.add_edge("skill_matcher_enhanced", "enhanced_analysis")
 
-    workflow.add_edge("scorer", "quality_checker")
-
-    workflow.add_conditional_edges(
-        "quality_checker",
-        should_reanalyze,
-        {"reanalyze": "experience_analyzer_enhanced", "continue": "bias_detector"},
-    )
+    # Fan-out: re-analysis happens inside enhanced_analysis, so go straight on
+    for node in ADDITIONAL_ANALYSIS_NODES:
+        workflow.add_edge("enhanced_analysis", node)
 
-    workflow.add_edge("bias_detector", "salary_estimator")
-    workflow.add_edge("salary_estimator", "ats_scorer")
-
-    workflow.add_edge("ats_scorer", "report_generator")
+    # Fan-in: report generation waits for all parallel analyses
+    workflow.add_edge(ADDITIONAL_ANALYSIS_NODES, "join_phase5")
+    workflow.add_edge("join_phase5", "report_generator")
     workflow.add_edge("report_generator", "question_generator")
 
     workflow.add_edge("question_generator", END)
 
-    print("Workflow edges connected")
+    logger.info("Workflow edges connected")
 
-    print("Compiling graph...")
-    app = workflow.compile()
+    logger.info("Compiling graph...")
+    app = workflow.compile(checkpointer=checkpointer)
 
-    print("Enhanced agentic graph created successfully!\n")
+    logger.info("Enhanced agentic graph created successfully!")
 
     return app
 
 
+@lru_cache(maxsize=1)
+def get_enhanced_screening_graph() -> StateGraph:
+    """
+    Get the compiled enhanced workflow, building it on first use
+
+    Compilation validates and wires the whole graph, so it is done once
+    per process and the compiled app is reused by every caller. The
+    returned app checkpoints to SQLite; run it with invoke_enhanced_screening.
+
+    Returns:
+        Compiled StateGraph ready for execution
+    """
+    return create_enhanced_screening_graph(checkpointer=create_checkpointer())
+
+
+def invoke_enhanced_screening(app, initial_state: dict, fresh: bool = False) -> dict:
+    """
+    Run the checkpointed workflow, skipping work already done for these inputs
+
+    - Interrupted run (e.g. crashed mid-way): resume from the first node
+      without a checkpoint
+    - Completed run: return its final state without re-executing
+    - Otherwise: start a new run
+
+    Args:
+        app: Compiled graph from get_enhanced_screening_graph
+        initial_state: Initial AgentState for the run
+        fresh: Discard any checkpoints for these inputs and run the whole
+            workflow again (e.g. after a run that only produced fallbacks)
+
+    Returns:
+        Final workflow state
+    """
+    thread_id = screening_thread_id(initial_state)
+    config = {"configurable": {"thread_id": thread_id}}
+
+    if fresh:
+        # A new run on the old thread would append to its candidate lists
+        app.checkpointer.delete_thread(thread_id)
+        return app.invoke(initial_state, config)
+
+    snapshot = app.get_state(config)
+
+    if snapshot.next:
+        logger.info(
+            "Resuming previous run from checkpoint at: %s", ", ".join(snapshot.next)
+        )
+        return app.invoke(None, config)
+
+    if snapshot.values:
+        logger.info("These inputs were already screened. Reusing checkpointed results.")
+        return snapshot.values
+
+    return app.invoke(initial_state, config)
+
+
 def visualize_enhanced_graph(output_path: str = "enhanced_workflow_diagram.png"):
     """Visualize the enhanced workflow graph"""
     try:
+        # Drawing only needs the structure, not the checkpoint database
         app = create_enhanced_screening_graph()
         graph_image = app.get_graph().draw_mermaid_png()
 
         with open(output_path, "wb") as f:
             f.write(graph_image)
 
-        print(f"Enhanced graph visualization saved to {output_path}")
+        logger.info("Enhanced graph visualization saved to %s", output_path)
 
     except Exception as e:
-        print(f"Could not generate graph visualization: {e}")
-        print("(This is optional - requires graphviz)")
+        logger.warning(
+            "Could not generate graph visualization: %s "
+            "(This is optional - requires graphviz)",
+            e,
+        )
 
 
 def print_graph_summary():
-    """Print a summary of the enhanced graph structure"""
-    print("\n" + "=" * 80)
-    print("ENHANCED AGENTIC WORKFLOW STRUCTURE")
-    print("=" * 80)
-
-    print("\nPHASE 1: Initial Analysis")
-    print("  1. Job Analyzer - Extract requirements from JD")
-    print("  2. Resume Parser - Parse all PDF resumes")
-
-    print("\nPHASE 2: Agentic Tool Selection & Enrichment")
-    print("  3. Tool Coordinator - LLM decides which tools to use per candidate")
-    print("  4. Candidate Enricher - Execute selected tools:")
-    print("     • Web Search (Company Verification)")
-    print("     • GitHub Analyzer (Skill Validation)")
-    print("     • Skill Taxonomy (Semantic Matching)")
-
-    print("\nPHASE 3: Enhanced Analysis")
-    print("  5. Skill Matcher Enhanced - Uses semantic taxonomy")
-    print("  6. Experience Analyzer Enhanced - Uses company data")
-    print("  7. Education Verifier")
-    print("  8. Scorer & Ranker")
-
-    print("\nPHASE 4: Quality Control & Self-Reflection")
-    print("  9. Quality Checker - Reviews analysis confidence")
-    print("     ├─→ [Low Confidence] Loop back to step 6 (re-analyze)")
-    print("     └─→ [High Confidence] Continue to next phase")
-
-    print("\nPHASE 5: Additional Analyses")
-    print("  10. Bias Detector - Flags potential hiring biases")
-    print("  11. Salary Estimator - Compensation recommendations")
-    print("  12. ATS Scorer - Resume optimization score")
-
-    print("\nPHASE 6: Output Generation")
-    print("  13. Report Generator - Comprehensive markdown report")
-    print("  14. Question Generator - Personalized interview questions")
-
-    print("\n" + "=" * 80)
-    print("KEY AGENTIC FEATURES:")
-    print("=" * 80)
-    print("  ✨ Tool Coordinator: LLM intelligently selects tools per candidate")
-    print("  ✨ Conditional Routing: Self-reflection can trigger re-analysis")
-    print("  ✨ Semantic Understanding: Skill taxonomy for better matching")
-    print("  ✨ Multi-Tool Enrichment: Web search + GitHub + taxonomy")
-    print("  ✨ Quality Assurance: Confidence validation with feedback loop")
-    print("  ✨ Fairness: Bias detection for ethical hiring")
-    print("  ✨ Comprehensive: Salary + ATS scoring for complete assessment")
-    print("=" * 80 + "\n")
+    """Log a summary of the enhanced graph structure"""
+    logger.info("%s", GRAPH_SUMMARY)
 
 
 # Test the graph
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("=" * 80)
     print("ENHANCED AGENTIC RESUME SCREENING GRAPH")
     print("=" * 80 + "\n")
@@ -204,14 +329,16 @@ if __name__ == "__main__":
     print_graph_summary()
 
     print("Creating enhanced graph...")
-    app = create_enhanced_screening_graph()
+    app = get_enhanced_screening_graph()
 
     print("\n" + "=" * 80)
     print("GRAPH STATISTICS")
     print("=" * 80)
-    print("  Total Nodes: 14")
-    print("  Conditional Edges: 1 (quality checker re-analysis)")
-    print("  Linear Edges: 12")
+    print("  Total Nodes: 12 (enhanced analysis wraps 4 steps, + phase 5 join)")
+    print("  Conditional Edges: 0 (re-analysis runs inside enhanced analysis)")
+    print("  Linear Edges: 7")
+    print("  Fan-out Edges: 3 (phase 5)")
+    print("  Fan-in Edges: 1 (phase 5 join)")
     print("  Entry Point: job_analyzer")
     print("  Exit Point: question_generator")
     print("=" * 80 + "\n")
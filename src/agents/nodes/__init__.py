@@ -9,6 +9,7 @@ from .ats_scorer import ats_scorer_node
 from .bias_detector import bias_detector_node
 from .candidate_enricher import candidate_enricher_node
 from .education_verifier import education_verifier_node
+from .enhanced_analysis import enhanced_analysis_node
 from .experience_analyzer import experience_analyzer_node
 from .experience_analyzer_enhanced import experience_analyzer_enhanced_node
 from .job_analyzer import job_analyzer_node
@@ -40,6 +41,7 @@ __all__ = [
     "skill_matcher_enhanced_node",
     "experience_analyzer_enhanced_node",
     "quality_checker_node",
+    "enhanced_analysis_node",
     "bias_detector_node",
     "salary_estimator_node",
     "ats_scorer_node",
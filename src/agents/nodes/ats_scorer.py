@@ -26,10 +26,10 @@ def ats_scorer_node(state: dict) -> dict:
 
     # Get resume texts
     resume_texts = {}
-    for resume_bytes, filename in zip(
-        state.get("resumes", []), state.get("resume_filenames", [])
+    for resume_path, filename in zip(
+        state.get("resume_paths", []), state.get("resume_filenames", [])
     ):
-        text = pdf_extractor.extract_text(resume_bytes)
+        text = pdf_extractor.extract_text(resume_path)
         resume_texts[filename] = text
 
     # Score each candidate
@@ -56,7 +56,7 @@ def ats_scorer_node(state: dict) -> dict:
 
     print(f"\nATS scoring complete for {len(ats_scores)} candidates\n")
 
-    return {"ats_scores": ats_scores, "current_step": "ats_scoring_complete"}
+    return {"ats_scores": ats_scores}
 
 
 # Test
@@ -77,7 +77,7 @@ if __name__ == "__main__":
                 "resume_file_name": "alice.pdf",
             }
         ],
-        "resumes": [b"mock pdf data"],
+        "resume_paths": ["data/sample_resumes/candidate_1.pdf"],
         "resume_filenames": ["alice.pdf"],
         "job_requirements": {
             "technical_skills": [{"name": "Python"}, {"name": "TensorFlow"}]
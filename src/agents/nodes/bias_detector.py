@@ -36,7 +36,7 @@ def bias_detector_node(state: dict) -> dict:
 
     print()
 
-    return {"bias_analysis": bias_analysis, "current_step": "bias_detection_complete"}
+    return {"bias_analysis": bias_analysis}
 
 
 # Test
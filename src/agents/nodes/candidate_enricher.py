@@ -5,6 +5,9 @@ Executes the tool plan by running selected tools for each candidate.
 Enriches candidate profiles with additional data.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from src.tools import GitHubAnalyzer, SkillTaxonomy, WebSearchTool
 
 
@@ -12,14 +15,21 @@ class CandidateEnricher:
     """
     Execute tool plan and enrich candidate profiles
 
-    Runs the tools selected by the Tool Coordinator
+    Runs the tools selected by the Tool Coordinator. Candidates are enriched
+    concurrently (bounded by max_inflight) and each candidate's tools run
+    side by side, since the lookups are independent and network-bound.
+    Web searches share one rate-limited DuckDuckGo client, so at most
+    max_search_inflight of them run at a time across all candidates.
     """
 
-    def __init__(self):
+    def __init__(self, max_inflight: int = 4, max_search_inflight: int = 1):
         self.web_search = WebSearchTool()
         self.github_analyzer = GitHubAnalyzer()
         self.skill_taxonomy = SkillTaxonomy()
 
+        self.max_inflight = max_inflight
+        self.max_search_inflight = max_search_inflight
+
         self.enrichment_cache = {"companies": {}, "github": {}, "skills": {}}
 
     def enrich_candidates(self, candidates: list[dict], tool_plan: dict) -> dict:
@@ -37,42 +47,45 @@ class CandidateEnricher:
                 "skill_taxonomy_data": {...}
             }
         """
+        coro = self.aenrich_candidates(candidates, tool_plan)
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # Called from inside a running event loop (e.g. a notebook), where
+        # asyncio.run would raise; run the coroutine on its own thread instead
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    async def aenrich_candidates(self, candidates: list[dict], tool_plan: dict) -> dict:
+        """Async variant of enrich_candidates"""
         print("⚡ Candidate Enricher: Executing tool plan...\n")
 
         company_verifications = {}
         github_analyses = {}
         skill_taxonomy_data = {}
 
-        for candidate in candidates:
-            candidate_name = candidate.get("name", "Unknown")
-
-            # Get tools for this candidate
-            plan = tool_plan.get(candidate_name, {})
-            tools = plan.get("tools", [])
-
-            if not tools:
-                print(f" Skipping {candidate_name} - no tools needed")
-                continue
-
-            print(f" Enriching {candidate_name} with tools: {', '.join(tools)}")
-
-            # Execute web search
-            if "web_search" in tools:
-                company_data = self._run_web_search(candidate)
-                if company_data:
-                    company_verifications[candidate_name] = company_data
-
-            # Execute GitHub analysis
-            if "github" in tools:
-                github_data = self._run_github_analysis(candidate)
-                if github_data:
-                    github_analyses[candidate_name] = github_data
-
-            # Execute skill taxonomy
-            if "skill_taxonomy" in tools:
-                taxonomy_data = self._run_skill_taxonomy(candidate)
-                if taxonomy_data:
-                    skill_taxonomy_data[candidate_name] = taxonomy_data
+        semaphore = asyncio.Semaphore(self.max_inflight)
+        search_semaphore = asyncio.Semaphore(self.max_search_inflight)
+
+        results = await asyncio.gather(
+            *(
+                self._enrich_candidate(
+                    candidate, tool_plan, semaphore, search_semaphore
+                )
+                for candidate in candidates
+            )
+        )
+
+        for candidate_name, company_data, github_data, taxonomy_data in results:
+            if company_data:
+                company_verifications[candidate_name] = company_data
+            if github_data:
+                github_analyses[candidate_name] = github_data
+            if taxonomy_data:
+                skill_taxonomy_data[candidate_name] = taxonomy_data
 
         print("\nEnrichment complete:")
         print(f"  - Companies verified: {len(company_verifications)}")
@@ -86,49 +99,118 @@ class CandidateEnricher:
             "skill_taxonomy_data": skill_taxonomy_data,
         }
 
-    def _run_web_search(self, candidate: dict) -> dict:
-        """Run web search for companies"""
-        work_exp = candidate.get("work_experience", [])
-        if not work_exp:
-            return {}
+    async def _enrich_candidate(
+        self,
+        candidate: dict,
+        tool_plan: dict,
+        semaphore: asyncio.Semaphore,
+        search_semaphore: asyncio.Semaphore,
+    ) -> tuple[str, dict, dict, dict]:
+        """
+        Run the planned tools for a single candidate
 
-        company_data = {}
+        Returns:
+            (candidate_name, company_data, github_data, taxonomy_data)
+        """
+        candidate_name = candidate.get("name", "Unknown")
 
-        # Search for each company (limit to top 3 most recent)
-        for exp in work_exp[:3]:
-            company_name = exp.get("company")
-            if not company_name:
-                continue
+        # Get tools for this candidate
+        plan = tool_plan.get(candidate_name, {})
+        tools = plan.get("tools", [])
 
-            # Check cache
-            if company_name in self.enrichment_cache["companies"]:
-                company_data[company_name] = self.enrichment_cache["companies"][
-                    company_name
-                ]
-                continue
+        if not tools:
+            print(f" Skipping {candidate_name} - no tools needed")
+            return candidate_name, {}, {}, {}
 
-            # Search
-            result = self.web_search.search_company(company_name)
-            company_data[company_name] = result
-            self.enrichment_cache["companies"][company_name] = result
+        async with semaphore:
+            print(f" Enriching {candidate_name} with tools: {', '.join(tools)}")
 
-        return company_data
+            # Web search and GitHub analysis are network-bound, run them together
+            company_data, github_data = await asyncio.gather(
+                self._run_web_search(candidate, search_semaphore)
+                if "web_search" in tools
+                else self._skip(),
+                self._run_github_analysis(candidate)
+                if "github" in tools
+                else self._skip(),
+                return_exceptions=True,
+            )
+
+            if isinstance(company_data, Exception):
+                print(f" Web search failed for {candidate_name}: {company_data}")
+                company_data = {}
+
+            if isinstance(github_data, Exception):
+                print(f" GitHub analysis failed for {candidate_name}: {github_data}")
+                github_data = {}
+
+            # Skill taxonomy is a local lookup, no need to offload it
+            taxonomy_data = (
+                self._run_skill_taxonomy(candidate) if "skill_taxonomy" in tools else {}
+            )
+
+        return candidate_name, company_data, github_data, taxonomy_data
+
+    async def _skip(self) -> dict:
+        """Placeholder for tools that are not in the plan"""
+        return {}
+
+    async def _shared_lookup(self, bucket: str, key: str, lookup) -> dict:
+        """
+        Run a lookup once per key for the whole screening run
 
-    def _run_github_analysis(self, candidate: dict) -> dict:
+        The cache stores the in-flight task, so concurrent candidates asking
+        for the same key await a single call instead of repeating it.
+        """
+        cache = self.enrichment_cache[bucket]
+        if key not in cache:
+            cache[key] = asyncio.ensure_future(lookup())
+        return await cache[key]
+
+    async def _search_company(
+        self, company_name: str, search_semaphore: asyncio.Semaphore
+    ) -> dict:
+        """Search one company, within the web search concurrency limit"""
+        async with search_semaphore:
+            return await self.web_search.asearch_company(company_name)
+
+    async def _run_web_search(
+        self, candidate: dict, search_semaphore: asyncio.Semaphore
+    ) -> dict:
+        """Run web search for companies"""
+        work_exp = candidate.get("work_experience", [])
+        if not work_exp:
+            return {}
+
+        # Search for each company (limit to top 3 most recent)
+        company_names = [
+            exp.get("company") for exp in work_exp[:3] if exp.get("company")
+        ]
+
+        results = await asyncio.gather(
+            *(
+                self._shared_lookup(
+                    "companies",
+                    self._normalize_key(name),
+                    lambda name=name: self._search_company(name, search_semaphore),
+                )
+                for name in company_names
+            )
+        )
+
+        return dict(zip(company_names, results))
+
+    async def _run_github_analysis(self, candidate: dict) -> dict:
         """Run GitHub analysis"""
         github_url = candidate.get("github_url")
         if not github_url:
             return {}
 
-        # Check cache
-        if github_url in self.enrichment_cache["github"]:
-            return self.enrichment_cache["github"][github_url]
-
-        # Analyze
-        result = self.github_analyzer.analyze_profile(github_url)
-        self.enrichment_cache["github"][github_url] = result
-
-        return result
+        return await self._shared_lookup(
+            "github",
+            self._normalize_key(github_url),
+            lambda: self.github_analyzer.aanalyze_profile(github_url),
+        )
 
     def _run_skill_taxonomy(self, candidate: dict) -> dict:
         """Run skill taxonomy analysis"""
@@ -140,7 +222,7 @@ class CandidateEnricher:
 
         # Get related skills for top skills
         for skill in skills[:10]:  # Top 10 skills
-            cache_key = skill.lower()
+            cache_key = self._normalize_key(skill)
 
             if cache_key in self.enrichment_cache["skills"]:
                 taxonomy_data[skill] = self.enrichment_cache["skills"][cache_key]
@@ -152,6 +234,11 @@ class CandidateEnricher:
 
         return taxonomy_data
 
+    @staticmethod
+    def _normalize_key(value: str) -> str:
+        """Normalize cache keys so casing/whitespace variants share an entry"""
+        return value.strip().lower()
+
 
 def candidate_enricher_node(state: dict) -> dict:
     """
@@ -0,0 +1,101 @@
+"""
+Enhanced Analysis Node
+
+Runs experience analysis, education verification, scoring and the quality
+check as a single LangGraph node, including any re-analysis the quality
+check asks for.
+"""
+
+import logging
+
+from .education_verifier import education_verifier_node
+from .experience_analyzer_enhanced import experience_analyzer_enhanced_node
+from .quality_checker import MAX_REANALYSIS, quality_checker_node
+from .scorer import rescore_subset, scorer_node
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+BANNER = "=" * 80
+
+REANALYSIS_BANNER = f"\n{BANNER}\nQUALITY CHECKER TRIGGERED RE-ANALYSIS\n{BANNER}"
+
+# Run in order; each step sees the state updates of the steps before it
+ANALYSIS_STEPS = (
+    experience_analyzer_enhanced_node,
+    education_verifier_node,
+    scorer_node,
+    quality_checker_node,
+)
+
+
+def enhanced_analysis_node(state: dict) -> dict:
+    """
+    LangGraph node: Experience, education, scoring and quality check
+
+    These steps always run back to back with no branching in between, so
+    they are called directly rather than as separate graph nodes. That
+    saves a graph step and state write per sub-node. The merged updates
+    are returned as one state update.
+
+    If the quality check has low confidence, only the flagged candidates
+    are re-analyzed, here in the node, at most MAX_REANALYSIS times. The
+    graph has no loop back into this node.
+    """
+    updates = {}
+
+    for step in ANALYSIS_STEPS:
+        updates.update(step({**state, **updates}))
+
+    # The quality checker increments reanalysis_count each time it asks
+    while (
+        updates["quality_check"]["needs_reanalysis"]
+        and updates["reanalysis_count"] <= MAX_REANALYSIS
+    ):
+        updates.update(_reanalyze({**state, **updates}))
+
+    if updates["quality_check"]["needs_reanalysis"]:
+        logger.warning(
+            "Maximum re-analysis attempts reached. Continuing with current results."
+        )
+
+    return updates
+
+
+def _reanalyze(state: dict) -> dict:
+    """
+    Redo experience analysis for the candidates flagged by the quality check
+
+    The new experience scores replace the flagged candidates' entries.
+    Only those candidates are re-scored; everyone is then re-ranked and
+    the quality check runs again.
+    """
+    flagged = set(state["quality_check"].get("candidates_to_reanalyze", []))
+    candidates = state["candidates"]
+
+    # Score lists are index-aligned with candidates
+    indices = [i for i, c in enumerate(candidates) if c.get("name") in flagged]
+    if not indices:
+        indices = list(range(len(candidates)))
+
+    logger.info(
+        "%s\nConfidence was too low. Re-analyzing %d candidate(s) (attempt %d/%d)...\n",
+        REANALYSIS_BANNER,
+        len(indices),
+        state["reanalysis_count"],
+        MAX_REANALYSIS,
+    )
+
+    redone = experience_analyzer_enhanced_node(
+        {**state, "candidates": [candidates[i] for i in indices]}
+    )["experience_scores"]
+
+    experience_scores = list(state["experience_scores"])
+    for i, score in zip(indices, redone):
+        experience_scores[i] = score
+
+    updates = {"experience_scores": experience_scores}
+    updates.update(rescore_subset({**state, **updates}, indices))
+    updates.update(quality_checker_node({**state, **updates}))
+
+    return updates
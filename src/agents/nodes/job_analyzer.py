@@ -11,6 +11,7 @@ from src.data_models import (
     SkillPriority,
 )
 from src.llm.groq_llm import GroqLLM
+from src.llm.llm_cache import get_llm_result_cache
 from src.utils.utils import extract_response_text
 
 
@@ -20,6 +21,9 @@ class JobAnalyzer:
     def __init__(self):
         self.llm = GroqLLM().get_llm_model()
 
+        # Screening more resumes against the same JD reuses its analysis
+        self.result_cache = get_llm_result_cache()
+
     def analyze(self, job_description: str) -> JobRequirements:
         """
         Extract structured job requirements from text
@@ -37,20 +41,14 @@ class JobAnalyzer:
             ),
             HumanMessage(content=prompt),
         ]
-        response = self.llm.invoke(messages)
-
-        try:
-            # Extract JSON from response (handle markdown code blocks)
-            response_text = extract_response_text(response)
-            job_data = json.loads(response_text)
 
-            # Convert to JobRequirements model
-            job_requirements = self._convert_to_model(job_data, job_description)
-            return job_requirements
+        # The prompt embeds the full job description, so it keys the cache
+        job_data = self.result_cache.batch_invoke(
+            self.llm, "job_requirements", [messages], self._parse_job_data
+        )[0]
 
-        except json.JSONDecodeError as e:
-            print(f"Error parsing LLM response: {e}")
-            print(f"Response was: {response.content}")
+        if isinstance(job_data, json.JSONDecodeError):
+            print(f"Error parsing LLM response: {job_data}")
             # Return a minimal JobRequirements object
             return JobRequirements(
                 job_title="Unknown",
@@ -62,6 +60,22 @@ class JobAnalyzer:
                 ),
             )
 
+        if isinstance(job_data, Exception):
+            raise job_data
+
+        # Convert to JobRequirements model
+        return self._convert_to_model(job_data, job_description)
+
+    def _parse_job_data(self, response) -> dict:
+        """Parse the LLM response into job data (raises if unusable)"""
+        # Extract JSON from response (handle markdown code blocks)
+        response_text = extract_response_text(response)
+        job_data = json.loads(response_text)
+
+        # Make sure it converts before it can be cached
+        self._convert_to_model(job_data, "")
+        return job_data
+
     def _convert_to_model(self, job_data: dict, original_jd: str) -> JobRequirements:
         """Convert raw JSON to JobRequirements Pydantic model"""
 
@@ -15,6 +15,9 @@ from config.prompts import ANALYSIS_QUALITY_ASSURANCE_PROMPT
 from src.llm.groq_llm import GroqLLM
 from src.utils.utils import extract_response_text
 
+# Maximum re-analysis attempts per screening run
+MAX_REANALYSIS = 2
+
 
 class QualityChecker:
     """
@@ -92,7 +95,7 @@ class QualityChecker:
         # Determine if reanalysis is needed
         needs_reanalysis = (
             overall_confidence < self.confidence_threshold
-            and reanalysis_count < 2  # Maximum 2 reanalysis attempts
+            and reanalysis_count < MAX_REANALYSIS
         )
 
         if needs_reanalysis:
@@ -263,6 +266,8 @@ class QualityChecker:
                 HumanMessage(content=prompt),
             ]
 
+            # Not cached: the summary can be unchanged after a re-analysis,
+            # and a replayed low-confidence verdict would force every retry
             response = self.llm.invoke(messages)
             response_text = extract_response_text(response)
 
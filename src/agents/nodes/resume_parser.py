@@ -1,5 +1,6 @@
 import json
 from datetime import date, datetime
+from pathlib import Path
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
@@ -20,13 +21,13 @@ class ResumeParser:
         self.text_processor = TextProcessor()
 
     def parse_resume(
-        self, resume_bytes: bytes, filename: str = "resume.pdf"
+        self, resume: bytes | str, filename: str = "resume.pdf"
     ) -> Candidate:
         """
         Parse a single resume PDF
 
         Args:
-            resume_bytes: PDF file as bytes
+            resume: Path to the PDF file, or the PDF as bytes
             filename: Original filename (for metadata)
 
         Returns:
@@ -35,7 +36,7 @@ class ResumeParser:
         print(f" Parsing resume: {filename}")
 
         # Step 1: Extract text from PDF
-        resume_text = self.pdf_extractor.extract_text(resume_bytes)
+        resume_text = self.pdf_extractor.extract_text(resume)
 
         if not resume_text or len(resume_text) < 100:
             print(f" Warning: Very little text extracted from {filename}")
@@ -214,21 +215,22 @@ def resume_parser_node(state: dict) -> dict:
     LangGraph node: Parse all resumes
 
     This node processes multiple resumes in parallel (conceptually)
-    and returns all parsed candidates.
+    and returns all parsed candidates. PDFs are read from disk one at a
+    time, so only the parsed candidates end up in state.
     """
     print(" Parsing resumes...")
 
     parser = ResumeParser()
     candidates = []
 
-    resumes = state.get("resumes", [])
+    resume_paths = state.get("resume_paths", [])
     filenames = state.get(
-        "resume_filenames", [f"resume_{i}.pdf" for i in range(len(resumes))]
+        "resume_filenames", [Path(path).name for path in resume_paths]
     )
 
-    for resume_bytes, filename in zip(resumes, filenames):
+    for resume_path, filename in zip(resume_paths, filenames):
         try:
-            candidate = parser.parse_resume(resume_bytes, filename)
+            candidate = parser.parse_resume(resume_path, filename)
             candidates.append(candidate.model_dump())
         except Exception as e:
             print(f" Error parsing {filename}: {e}")
@@ -246,10 +248,9 @@ if __name__ == "__main__":
     # Test with a sample resume
     parser = ResumeParser()
 
-    with open("data/sample_resumes/candidate_1.pdf", "rb") as f:
-        resume_bytes = f.read()
-
-    candidate = parser.parse_resume(resume_bytes, "test_resume.pdf")
+    candidate = parser.parse_resume(
+        "data/sample_resumes/candidate_1.pdf", "test_resume.pdf"
+    )
 
     print("\nParsed Candidate:")
     print(f"Name: {candidate.name}")
@@ -21,24 +21,22 @@ def salary_estimator_node(state: dict) -> dict:
 
     salary_estimates = {}
 
-    for candidate_data in state["candidates"]:
-        candidate_name = candidate_data.get("name", "Unknown")
-
-        print(f"  Estimating salary for {candidate_name}...")
+    # All candidates are estimated together so the LLM calls are batched
+    estimates = estimator.estimate_salaries(
+        state["candidates"], state["job_requirements"]
+    )
 
-        estimate = estimator.estimate_salary(candidate_data, state["job_requirements"])
+    for candidate_data, estimate in zip(state["candidates"], estimates):
+        candidate_name = candidate_data.get("name", "Unknown")
 
         salary_estimates[candidate_name] = estimate
 
         median = estimate["adjusted_range"]["median"]
-        print(f"  Median estimate: ${median:,}")
+        print(f"  Median estimate for {candidate_name}: ${median:,}")
 
     print(f"\nSalary estimation complete for {len(salary_estimates)} candidates\n")
 
-    return {
-        "salary_estimates": salary_estimates,
-        "current_step": "salary_estimation_complete",
-    }
+    return {"salary_estimates": salary_estimates}
 
 
 # Test
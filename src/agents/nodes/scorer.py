@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+
+import numpy as np
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from config.prompts import (
@@ -18,6 +21,52 @@ from src.llm.groq_llm import GroqLLM
 from src.utils.utils import extract_response_text
 
 
+@dataclass
+class CandidateColumns:
+    """
+    Column-oriented view of the component scores for a batch of candidates
+
+    Holds one array per score component so weighting runs as a single
+    vectorized operation instead of per-candidate Python arithmetic.
+    """
+
+    skill_match: np.ndarray
+    experience_match: np.ndarray
+    education_score: np.ndarray
+
+    @classmethod
+    def from_scores(
+        cls,
+        skill_scores: list[SkillScore],
+        experience_scores: list[ExperienceScore],
+        education_scores: list[EducationScore],
+    ) -> "CandidateColumns":
+        """Build the columns from per-candidate score models"""
+        return cls(
+            skill_match=np.fromiter(
+                (s.overall_skill_score for s in skill_scores),
+                dtype=np.float64,
+                count=len(skill_scores),
+            ),
+            experience_match=np.fromiter(
+                (e.experience_match_score for e in experience_scores),
+                dtype=np.float64,
+                count=len(experience_scores),
+            ),
+            education_score=np.fromiter(
+                (e.education_score for e in education_scores),
+                dtype=np.float64,
+                count=len(education_scores),
+            ),
+        )
+
+    def as_matrix(self) -> np.ndarray:
+        """Stack the columns into an (N, 3) matrix: skill, experience, education"""
+        return np.column_stack(
+            (self.skill_match, self.experience_match, self.education_score)
+        )
+
+
 class CandidateScorer:
     """Scores and ranks candidates using weighted scoring + LLM analysis"""
 
@@ -59,6 +108,13 @@ class CandidateScorer:
         exp_score_models = [ExperienceScore(**e) for e in experience_scores]
         edu_score_models = [EducationScore(**e) for e in education_scores]
 
+        # Weight and total all component scores in one pass
+        columns = CandidateColumns.from_scores(
+            skill_score_models, exp_score_models, edu_score_models
+        )
+        weighted = self._weight_columns(columns)
+        totals = self._combine_weighted(weighted)
+
         # Score each candidate
         candidate_scores = []
         for i, candidate in enumerate(candidate_models):
@@ -68,18 +124,123 @@ class CandidateScorer:
                 skill_score_models[i],
                 exp_score_models[i],
                 edu_score_models[i],
+                weighted_scores=tuple(weighted[i].tolist()),
+                total_score=totals[i].item(),
             )
             candidate_scores.append(score)
 
-        # Sort by total score (highest first)
-        candidate_scores.sort(key=lambda x: x.total_score, reverse=True)
+        return self._rank_candidates(candidate_scores, totals)
+
+    def rescore_candidates(
+        self,
+        candidates: list[dict],
+        job_requirements: dict,
+        skill_scores: list[dict],
+        experience_scores: list[dict],
+        education_scores: list[dict],
+        ranked_candidates: list[dict],
+        indices: list[int],
+    ) -> list[RankedCandidate]:
+        """
+        Re-score only the candidates at indices, then re-rank everyone
+
+        Other candidates keep their existing CandidateScore, and comparison
+        notes are reused wherever a candidate's rank, score and neighbours
+        are unchanged, so LLM calls scale with the candidates that changed.
+
+        Args:
+            candidates, job_requirements, *_scores: As for
+                score_and_rank_candidates, with the updated scores
+            ranked_candidates: Ranked candidate dicts from the previous scoring
+            indices: Positions in candidates to re-score
+
+        Returns:
+            List of RankedCandidate objects (sorted by score)
+        """
+        print(f"Re-scoring {len(indices)} candidate(s) and re-ranking...")
+
+        job_req = JobRequirements(**job_requirements)
+        skill_score_models = [SkillScore(**s) for s in skill_scores]
+        exp_score_models = [ExperienceScore(**e) for e in experience_scores]
+        edu_score_models = [EducationScore(**e) for e in education_scores]
+
+        # Totals come from the component scores, so they are recomputed for
+        # everyone without any LLM calls
+        columns = CandidateColumns.from_scores(
+            skill_score_models, exp_score_models, edu_score_models
+        )
+        weighted = self._weight_columns(columns)
+        totals = self._combine_weighted(weighted)
+
+        # Previous scores and comparison notes
+        previous = [RankedCandidate(**rc) for rc in ranked_candidates]
+        previous.sort(key=lambda rc: rc.rank)
+        previous_scores = [rc.candidate_score for rc in previous]
+
+        known_notes = {}
+        for rc in previous:
+            prompt = self._build_comparison_prompt(
+                rc.candidate_score, rc.rank, len(previous), previous_scores
+            )
+            # Empty notes mean the earlier call failed, so ask again
+            if prompt is not None and rc.comparison_notes:
+                known_notes[prompt] = rc.comparison_notes
+
+        # Match previous scores back to candidate order by name
+        by_name = {}
+        for score in previous_scores:
+            by_name.setdefault(score.candidate_name, []).append(score)
+
+        candidate_scores = [
+            by_name[c.get("name")].pop(0) if by_name.get(c.get("name")) else None
+            for c in candidates
+        ]
+
+        flagged = set(indices)
+        for i, candidate_data in enumerate(candidates):
+            if i in flagged or candidate_scores[i] is None:
+                candidate_scores[i] = self._score_candidate(
+                    Candidate(**candidate_data),
+                    job_req,
+                    skill_score_models[i],
+                    exp_score_models[i],
+                    edu_score_models[i],
+                    weighted_scores=tuple(weighted[i].tolist()),
+                    total_score=totals[i].item(),
+                )
+
+        return self._rank_candidates(candidate_scores, totals, known_notes)
+
+    def _rank_candidates(
+        self,
+        candidate_scores: list[CandidateScore],
+        totals: np.ndarray,
+        known_notes: dict[str, str] | None = None,
+    ) -> list[RankedCandidate]:
+        """
+        Rank scored candidates and add comparative analysis
+
+        known_notes maps comparison prompts to notes already generated for
+        them; those are reused instead of asking the LLM again.
+        """
+        known_notes = known_notes or {}
+
+        # Sort by total score (highest first); stable, so ties keep input order
+        order = np.argsort(-totals, kind="stable")
+        candidate_scores = [candidate_scores[i] for i in order.tolist()]
 
         # Create ranked candidates with comparative analysis
         ranked_candidates = []
         for rank, score in enumerate(candidate_scores, 1):
-            comparison = self._generate_comparative_analysis(
+            prompt = self._build_comparison_prompt(
                 score, rank, len(candidate_scores), candidate_scores
             )
+            if prompt is None:
+                comparison = ""
+            elif prompt in known_notes:
+                comparison = known_notes[prompt]
+            else:
+                comparison = self._generate_comparative_analysis(prompt)
 
             ranked = RankedCandidate(
                 rank=rank, candidate_score=score, comparison_notes=comparison
@@ -93,6 +254,32 @@ class CandidateScorer:
 
         return ranked_candidates
 
+    def _weight_columns(self, columns: CandidateColumns) -> np.ndarray:
+        """
+        Apply the configured weights to every candidate at once
+
+        Returns:
+            (N, 3) array of weighted skill, experience and education scores
+        """
+        weights = np.array(
+            [self.skill_weight, self.experience_weight, self.education_weight],
+            dtype=np.float64,
+        )
+        return columns.as_matrix() * weights
+
+    @staticmethod
+    def _combine_weighted(weighted: np.ndarray) -> np.ndarray:
+        """
+        Total the weighted scores of every candidate at once
+
+        Adds the columns in the same order as the per-candidate sum, so the
+        totals are bit-for-bit identical to it.
+
+        Returns:
+            (N,) array of total scores
+        """
+        return weighted[:, 0] + weighted[:, 1] + weighted[:, 2]
+
     def _score_candidate(
         self,
         candidate: Candidate,
@@ -100,6 +287,8 @@ class CandidateScorer:
         skill_score: SkillScore,
         experience_score: ExperienceScore,
         education_score: EducationScore,
+        weighted_scores: tuple[float, float, float] | None = None,
+        total_score: float | None = None,
     ) -> CandidateScore:
         """
         Calculate comprehensive score for a candidate
@@ -108,15 +297,24 @@ class CandidateScorer:
         - Skills: 50% (configurable)
         - Experience: 30% (configurable)
         - Education: 20% (configurable)
+
+        weighted_scores and total_score can carry the pre-computed values
+        from _weight_columns and _combine_weighted.
         """
 
         # Calculate weighted scores
-        weighted_skill = skill_score.overall_skill_score * self.skill_weight
-        weighted_exp = experience_score.experience_match_score * self.experience_weight
-        weighted_edu = education_score.education_score * self.education_weight
+        if weighted_scores is None:
+            weighted_skill = skill_score.overall_skill_score * self.skill_weight
+            weighted_exp = (
+                experience_score.experience_match_score * self.experience_weight
+            )
+            weighted_edu = education_score.education_score * self.education_weight
+        else:
+            weighted_skill, weighted_exp, weighted_edu = weighted_scores
 
         # Total score
-        total_score = weighted_skill + weighted_exp + weighted_edu
+        if total_score is None:
+            total_score = weighted_skill + weighted_exp + weighted_edu
 
         # Determine recommendation level
         recommendation, confidence = self._determine_recommendation(
@@ -268,22 +466,22 @@ class CandidateScorer:
                 "detailed_analysis": f"{candidate.name} scored {total_score:.1f}% overall.",
             }
 
-    def _generate_comparative_analysis(
+    def _build_comparison_prompt(
         self,
         candidate_score: CandidateScore,
         rank: int,
         total_candidates: int,
         all_scores: list[CandidateScore],
-    ) -> str:
+    ) -> str | None:
         """
-        Generate comparative analysis using LLM
+        Build the comparative analysis prompt for a ranked candidate
 
-        Explains why this candidate ranks where they do relative to others
+        Returns None when no comparison is needed.
         """
 
         # Only do comparative analysis for top 5
         if rank > 5 or total_candidates < 2:
-            return ""
+            return None
 
         # Get context of nearby candidates
         context_candidates = []
@@ -321,6 +519,14 @@ class CandidateScorer:
             context=context_str,
         )
 
+        return prompt
+
+    def _generate_comparative_analysis(self, prompt: str) -> str:
+        """
+        Generate comparative analysis using LLM
+
+        Explains why this candidate ranks where they do relative to others
+        """
         try:
             messages = [
                 SystemMessage(
@@ -353,6 +559,32 @@ def scorer_node(state: dict) -> dict:
         state["education_scores"],
     )
 
+    return _scoring_update(ranked_candidates)
+
+
+def rescore_subset(state: dict, indices: list[int]) -> dict:
+    """
+    Re-score the candidates at indices and re-rank all candidates
+
+    Used for re-analysis; returns the same state update as scorer_node.
+    """
+    scorer = CandidateScorer()
+
+    ranked_candidates = scorer.rescore_candidates(
+        state["candidates"],
+        state["job_requirements"],
+        state["skill_scores"],
+        state["experience_scores"],
+        state["education_scores"],
+        state["ranked_candidates"],
+        indices,
+    )
+
+    return _scoring_update(ranked_candidates)
+
+
+def _scoring_update(ranked_candidates: list[RankedCandidate]) -> dict:
+    """Build the scoring state update from ranked candidates"""
     # Convert to dicts for state
     candidate_scores = [rc.candidate_score.model_dump() for rc in ranked_candidates]
     ranked_dicts = [rc.model_dump() for rc in ranked_candidates]
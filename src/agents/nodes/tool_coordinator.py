@@ -11,6 +11,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from config.prompts import VERIFICATION_TOOL_SELECTION_PROMPT
 from src.llm.groq_llm import GroqLLM
+from src.llm.llm_cache import get_llm_result_cache
 from src.utils.utils import extract_response_text
 
 
@@ -27,6 +28,9 @@ class ToolCoordinator:
     def __init__(self):
         self.llm = GroqLLM().get_llm_model()
 
+        # Plans for identical candidate/job prompts are reused across runs
+        self.result_cache = get_llm_result_cache()
+
     def create_tool_plan(self, candidates: list[dict], job_requirements: dict) -> dict:
         """
         Create a tool execution plan for all candidates
@@ -48,12 +52,25 @@ class ToolCoordinator:
 
         tool_plan = {}
 
-        for candidate in candidates:
+        batch = [
+            self._build_tool_selection_messages(candidate, job_requirements)
+            for candidate in candidates
+        ]
+
+        # Let LLM decide which tools to use, one batched request for all
+        # candidates without a cached plan
+        plans = self.result_cache.batch_invoke(
+            self.llm, "tool_plan", batch, self._parse_tool_plan
+        )
+
+        for candidate, plan in zip(candidates, plans):
             candidate_name = candidate.get("name", "Unknown")
             print(f" Planning tools for {candidate_name}...")
 
-            # Let LLM decide which tools to use
-            plan = self._decide_tools_for_candidate(candidate, job_requirements)
+            if isinstance(plan, Exception):
+                print(f" Tool planning failed for {candidate_name}: {plan}")
+                plan = self._fallback_tool_plan()
+
             tool_plan[candidate_name] = plan
 
             tools_str = ", ".join(plan["tools"]) if plan["tools"] else "None"
@@ -64,11 +81,11 @@ class ToolCoordinator:
 
         return tool_plan
 
-    def _decide_tools_for_candidate(
+    def _build_tool_selection_messages(
         self, candidate: dict, job_requirements: dict
-    ) -> dict:
+    ) -> list:
         """
-        Use LLM to decide which tools to use for a specific candidate
+        Build the LLM prompt that decides which tools to use for a candidate
 
         This is where the agent makes intelligent decisions!
         """
@@ -95,32 +112,31 @@ class ToolCoordinator:
             tools_description=tools_description,
         )
 
-        try:
-            messages = [
-                SystemMessage(
-                    content="You are an intelligent hiring coordinator making strategic tool selection decisions."
-                ),
-                HumanMessage(content=prompt),
-            ]
-
-            response = self.llm.invoke(messages)
-            response_text = extract_response_text(response)
-            plan = json.loads(response_text)
-
-            # Validate tools list
-            valid_tools = ["web_search", "github", "skill_taxonomy"]
-            plan["tools"] = [t for t in plan.get("tools", []) if t in valid_tools]
-
-            return plan
-
-        except Exception as e:
-            print(f" Tool planning failed for {candidate.get('name')}: {e}")
-            # Default fallback: use skill taxonomy for everyone
-            return {
-                "tools": ["skill_taxonomy"],
-                "reasoning": "Using default tool set due to planning error",
-                "priority": "medium",
-            }
+        return [
+            SystemMessage(
+                content="You are an intelligent hiring coordinator making strategic tool selection decisions."
+            ),
+            HumanMessage(content=prompt),
+        ]
+
+    def _parse_tool_plan(self, response) -> dict:
+        """Turn the LLM response into a tool plan (raises if unparseable)"""
+        response_text = extract_response_text(response)
+        plan = json.loads(response_text)
+
+        # Validate tools list
+        valid_tools = ["web_search", "github", "skill_taxonomy"]
+        plan["tools"] = [t for t in plan.get("tools", []) if t in valid_tools]
+
+        return plan
+
+    def _fallback_tool_plan(self) -> dict:
+        """Default plan when planning fails: use skill taxonomy for everyone"""
+        return {
+            "tools": ["skill_taxonomy"],
+            "reasoning": "Using default tool set due to planning error",
+            "priority": "medium",
+        }
 
     def _format_candidate_summary(self, candidate: dict) -> str:
         """Format candidate info for LLM"""
@@ -1,9 +1,31 @@
 """GroqAPI LLM Module"""
 
+import atexit
+import functools
+
+import httpx
 from langchain_groq import ChatGroq
 
 from config.settings import settings
 
+# One connection pool shared by every Groq model, so nodes reuse warm TLS
+# connections instead of each opening their own.
+_HTTP_CLIENT = httpx.Client(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=httpx.Timeout(60.0, connect=5.0),
+)
+atexit.register(_HTTP_CLIENT.close)
+
+
+@functools.cache
+def _create_chat_model(model_name: str, api_key: str | None) -> ChatGroq:
+    """Create a ChatGroq on the shared pool, once per model/key"""
+    return ChatGroq(
+        model=model_name,
+        groq_api_key=api_key,
+        http_client=_HTTP_CLIENT,
+    )
+
 
 class GroqLLM:
     """
@@ -18,8 +40,10 @@ class GroqLLM:
         """
         Get the Groq LLM model based on user input.
 
+        Model instances are shared across callers and all use the same
+        HTTP connection pool.
+
         Returns:
             ChatGroq: An instance of the GroqAPI LLM.
         """
-        llm = ChatGroq(model=self.model_name, groq_api_key=self.api_key)
-        return llm
+        return _create_chat_model(self.model_name, self.api_key)
@@ -0,0 +1,158 @@
+"""Persistent LLM Response Cache"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Callable
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class LLMResultCache:
+    """
+    SQLite-backed cache of parsed LLM results, with expiry
+
+    Callers store a result only after the LLM response parsed successfully,
+    so a malformed reply is retried on the next run instead of replaying
+    its fallback. Entries older than ttl_seconds are ignored and purged.
+
+    The cache fails open: database errors (e.g. a locked file) are logged
+    and treated as a miss, so they never fail the calling node.
+    """
+
+    def __init__(self, database_path: str, ttl_seconds: int):
+        self.database_path = database_path
+        self.ttl_seconds = ttl_seconds
+
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_results (key TEXT PRIMARY KEY, "
+                    "value TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                conn.execute(
+                    "DELETE FROM llm_results WHERE created_at < ?",
+                    (time.time() - ttl_seconds,),
+                )
+        except sqlite3.Error as e:
+            logger.warning("LLM result cache unavailable: %s", e)
+
+    @staticmethod
+    def make_key(namespace: str, *parts: str) -> str:
+        """
+        Build a cache key from the prompt parts and the model settings
+
+        The model name and temperature are part of the key, so switching
+        models does not reuse results produced by another one.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (settings.MODEL_NAME, str(settings.TEMPERATURE), *parts):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return f"{namespace}:{digest.hexdigest()}"
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached result for key, or None if missing or expired"""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT value, created_at FROM llm_results WHERE key = ?", (key,)
+                ).fetchone()
+
+                if row is not None and time.time() - row[1] > self.ttl_seconds:
+                    with conn:
+                        conn.execute("DELETE FROM llm_results WHERE key = ?", (key,))
+                    return None
+        except sqlite3.Error as e:
+            logger.warning("LLM result cache read failed: %s", e)
+            return None
+
+        return json.loads(row[0]) if row is not None else None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a successfully parsed result"""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_results VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.warning("LLM result cache write failed: %s", e)
+
+    def batch_invoke(
+        self,
+        llm,
+        namespace: str,
+        batch: list[list],
+        parse: Callable[[Any], Any],
+    ) -> list:
+        """
+        Run prompts through the LLM, reusing cached parsed results
+
+        Prompts without a cached result are sent in one llm.batch call.
+        parse turns a reply into the result; only results it returns are
+        cached, so a reply it rejects (by raising) is retried next run.
+
+        Args:
+            llm: Chat model to call on a cache miss
+            namespace: Cache key prefix for this kind of result
+            batch: List of message lists, one per prompt
+            parse: Converts an LLM reply into a JSON-serializable result
+
+        Returns:
+            One entry per prompt: the result, or the exception raised by
+            the request or by parse
+        """
+        keys = [
+            self.make_key(namespace, *(m.content for m in messages))
+            for messages in batch
+        ]
+        results = [self.get(key) for key in keys]
+
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results
+
+        responses = llm.batch([batch[i] for i in misses], return_exceptions=True)
+
+        for i, response in zip(misses, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                results[i] = parse(response)
+            except Exception as e:
+                results[i] = e
+                continue
+
+            self.set(keys[i], results[i])
+
+        return results
+
+    def _connect(self) -> sqlite3.Connection:
+        # Short-lived connections, so the cache is safe to use from any thread
+        return sqlite3.connect(self.database_path, timeout=30)
+
+
+@lru_cache(maxsize=1)
+def get_llm_result_cache() -> LLMResultCache:
+    """
+    Get the shared cache of parsed LLM results.
+
+    Returns:
+        LLMResultCache: The process-wide cache instance.
+    """
+    cache_dir = Path(settings.CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return LLMResultCache(
+        str(cache_dir / settings.LLM_CACHE_DB), settings.LLM_CACHE_TTL_SECONDS
+    )
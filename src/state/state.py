@@ -4,11 +4,17 @@ from typing import Annotated, TypedDict
 from langchain_core.messages import BaseMessage
 
 
-class AgentState(TypedDict):
-    """State that flows through the agent graph"""
+class AgentState(TypedDict, total=False):
+    """
+    State that flows through the agent graph
+
+    Keys are optional: callers seed only the inputs and each node returns
+    just the keys it writes. LangGraph keeps one channel per key, so an
+    update only touches the channels a node actually returns.
+    """
 
     job_description: str
-    resumes: list[bytes]
+    resume_paths: list[str]
     resume_filenames: list[str] | None
 
     job_requirements: dict | None
@@ -4,6 +4,7 @@ GitHub Profile Analyzer
 Analyzes GitHub profiles to validate coding skills and activity.
 """
 
+import asyncio
 import os
 from collections import Counter
 
@@ -146,6 +147,15 @@ class GitHubAnalyzer:
             print(f"    ⚠️  GitHub analysis failed: {e}")
             return self._empty_profile(f"Analysis error: {str(e)}")
 
+    async def aanalyze_profile(self, github_url: str) -> dict:
+        """
+        Async variant of analyze_profile
+
+        PyGithub is a blocking client, so the analysis runs in a worker
+        thread alongside the other enrichment tools.
+        """
+        return await asyncio.to_thread(self.analyze_profile, github_url)
+
     def validate_skills(self, github_url: str, claimed_skills: list[str]) -> dict:
         """
         Validate claimed skills against GitHub activity
@@ -8,10 +8,17 @@ class PDFExtractor:
     """Extract text from PDF resumes"""
 
     @staticmethod
-    def extract_text_pypdf2(pdf_bytes: bytes) -> str:
+    def _open_source(pdf_source: bytes | str):
+        """Wrap in-memory PDFs; file paths are passed through and read lazily"""
+        if isinstance(pdf_source, bytes):
+            return io.BytesIO(pdf_source)
+        return pdf_source
+
+    @classmethod
+    def extract_text_pypdf2(cls, pdf_source: bytes | str) -> str:
         """Extract text using PyPDF2"""
         try:
-            pdf_file = io.BytesIO(pdf_bytes)
+            pdf_file = cls._open_source(pdf_source)
             reader = PyPDF2.PdfReader(pdf_file)
             text = ""
             for page in reader.pages:
@@ -21,11 +28,11 @@ class PDFExtractor:
             print(f"PyPDF2 extraction failed: {e}")
             return ""
 
-    @staticmethod
-    def extract_text_pdfplumber(pdf_bytes: bytes) -> str:
+    @classmethod
+    def extract_text_pdfplumber(cls, pdf_source: bytes | str) -> str:
         """Extract text using pdfplumber (better for complex layouts)"""
         try:
-            pdf_file = io.BytesIO(pdf_bytes)
+            pdf_file = cls._open_source(pdf_source)
             text = ""
             with pdfplumber.open(pdf_file) as pdf:
                 for page in pdf.pages:
@@ -38,25 +45,25 @@ class PDFExtractor:
             return ""
 
     @classmethod
-    def extract_text(cls, pdf_bytes: bytes, method: str = "pdfplumber") -> str:
+    def extract_text(cls, pdf_source: bytes | str, method: str = "pdfplumber") -> str:
         """
-        Extract text from PDF bytes
+        Extract text from a PDF
 
         Args:
-            pdf_bytes: PDF file as bytes
+            pdf_source: PDF file as bytes, or path to a PDF file
             method: 'pdfplumber' or 'pypdf2'
 
         Returns:
             Extracted text
         """
         if method == "pdfplumber":
-            text = cls.extract_text_pdfplumber(pdf_bytes)
+            text = cls.extract_text_pdfplumber(pdf_source)
             if not text:  # Fallback to PyPDF2
-                text = cls.extract_text_pypdf2(pdf_bytes)
+                text = cls.extract_text_pypdf2(pdf_source)
         else:
-            text = cls.extract_text_pypdf2(pdf_bytes)
+            text = cls.extract_text_pypdf2(pdf_source)
             if not text:  # Fallback to pdfplumber
-                text = cls.extract_text_pdfplumber(pdf_bytes)
+                text = cls.extract_text_pdfplumber(pdf_source)
 
         return text
 
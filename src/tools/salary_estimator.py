@@ -78,71 +78,92 @@ class SalaryEstimator:
                 "confidence": float
             }
         """
-        print(
-            f"    💰 Estimating salary for {candidate_profile.get('name', 'candidate')}..."
-        )
+        return self.estimate_salaries([candidate_profile], job_requirements)[0]
 
-        # Determine experience level
-        experience_level = self._determine_experience_level(
-            candidate_profile.get("total_experience_years", 0),
-            job_requirements.get("job_title", ""),
-        )
+    def estimate_salaries(
+        self, candidate_profiles: list[dict], job_requirements: dict
+    ) -> list[dict]:
+        """
+        Estimate salary ranges for several candidates at once
 
-        # Get base salary range
-        base_range = self.base_salaries.get(
-            experience_level, self.base_salaries["Mid-Level"]
-        )
+        The LLM prompts for all candidates go out through llm.batch (one
+        batch for skill premiums, one for explanations) instead of two
+        sequential round trips per candidate.
 
-        # Calculate multipliers
-        location = candidate_profile.get("location", "Remote")
-        location_mult = self._get_location_multiplier(location)
+        Args:
+            candidate_profiles: Candidate dicts
+            job_requirements: Job requirements including title, industry
 
+        Returns:
+            One estimate per candidate, in input order (see estimate_salary)
+        """
         industry = self._extract_industry(job_requirements)
         industry_mult = self.industry_multipliers.get(industry, 1.0)
 
         # Skills premium (LLM-based)
-        skills_analysis = self._analyze_skills_premium(
-            candidate_profile.get("technical_skills", []), job_requirements
+        skills_analyses = self._analyze_skills_premiums(
+            [c.get("technical_skills", []) for c in candidate_profiles],
+            job_requirements,
         )
-        skills_premium = skills_analysis["premium"]
 
-        # Calculate adjusted range
-        total_multiplier = location_mult * industry_mult * (1 + skills_premium)
+        estimates = []
+        for candidate_profile, skills_analysis in zip(
+            candidate_profiles, skills_analyses
+        ):
+            print(
+                f"    💰 Estimating salary for {candidate_profile.get('name', 'candidate')}..."
+            )
+
+            # Determine experience level
+            experience_level = self._determine_experience_level(
+                candidate_profile.get("total_experience_years", 0),
+                job_requirements.get("job_title", ""),
+            )
+
+            # Get base salary range
+            base_range = self.base_salaries.get(
+                experience_level, self.base_salaries["Mid-Level"]
+            )
+
+            # Calculate multipliers
+            location = candidate_profile.get("location", "Remote")
+            location_mult = self._get_location_multiplier(location)
+
+            skills_premium = skills_analysis["premium"]
+
+            # Calculate adjusted range
+            total_multiplier = location_mult * industry_mult * (1 + skills_premium)
+
+            adjusted_range = {
+                "min": int(base_range["min"] * total_multiplier),
+                "max": int(base_range["max"] * total_multiplier),
+                "median": int(base_range["median"] * total_multiplier),
+            }
 
-        adjusted_range = {
-            "min": int(base_range["min"] * total_multiplier),
-            "max": int(base_range["max"] * total_multiplier),
-            "median": int(base_range["median"] * total_multiplier),
-        }
+            estimates.append(
+                {
+                    "base_range": base_range,
+                    "adjusted_range": adjusted_range,
+                    "factors": {
+                        "experience_level": experience_level,
+                        "location_multiplier": location_mult,
+                        "industry_multiplier": industry_mult,
+                        "skills_premium": skills_premium,
+                    },
+                    "reasoning": "",
+                    # Confidence based on data completeness
+                    "confidence": self._calculate_confidence(candidate_profile),
+                }
+            )
 
         # Generate reasoning using LLM
-        reasoning = self._generate_salary_reasoning(
-            candidate_profile,
-            job_requirements,
-            experience_level,
-            adjusted_range,
-            {
-                "location": location_mult,
-                "industry": industry_mult,
-                "skills": skills_premium,
-            },
+        reasonings = self._generate_salary_reasonings(
+            candidate_profiles, job_requirements, estimates
         )
+        for estimate, reasoning in zip(estimates, reasonings):
+            estimate["reasoning"] = reasoning
 
-        # Confidence based on data completeness
-        confidence = self._calculate_confidence(candidate_profile)
-
-        return {
-            "base_range": base_range,
-            "adjusted_range": adjusted_range,
-            "factors": {
-                "experience_level": experience_level,
-                "location_multiplier": location_mult,
-                "industry_multiplier": industry_mult,
-                "skills_premium": skills_premium,
-            },
-            "reasoning": reasoning,
-            "confidence": confidence,
-        }
+        return estimates
 
     def _determine_experience_level(self, years: float, job_title: str) -> str:
         """Determine experience level"""
@@ -194,79 +215,106 @@ class SalaryEstimator:
 
         return "default"
 
-    def _analyze_skills_premium(
-        self, candidate_skills: list[str], job_requirements: dict
-    ) -> dict:
+    def _analyze_skills_premiums(
+        self, skill_lists: list[list[str]], job_requirements: dict
+    ) -> list[dict]:
         """
-        Use LLM to assess if candidate has premium/rare skills
+        Use LLM to assess if candidates have premium/rare skills
 
-        Returns skills premium as a multiplier (0.0 to 0.3)
+        Returns one skills premium per candidate as a multiplier (0.0 to 0.3)
         """
-        if not candidate_skills:
-            return {"premium": 0.0, "reasoning": "No skills data"}
+        results = [{"premium": 0.0, "reasoning": "No skills data"} for _ in skill_lists]
 
-        prompt = SALARY_PREMIUM_SKILL_ANALYSIS_PROMPT.format(
-            candidate_skills=", ".join(candidate_skills[:20]),
-            job_title=job_requirements.get("job_title", "Technical Role"),
-        )
+        pending = [i for i, skills in enumerate(skill_lists) if skills]
+        if not pending:
+            return results
 
-        try:
-            messages = [
+        batch = [
+            [
                 SystemMessage(
                     content="You are a compensation analyst assessing skill premiums."
                 ),
-                HumanMessage(content=prompt),
+                HumanMessage(
+                    content=SALARY_PREMIUM_SKILL_ANALYSIS_PROMPT.format(
+                        candidate_skills=", ".join(skill_lists[i][:20]),
+                        job_title=job_requirements.get("job_title", "Technical Role"),
+                    )
+                ),
             ]
+            for i in pending
+        ]
+
+        responses = self.llm.batch(batch, return_exceptions=True)
+
+        for i, response in zip(pending, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                response_text = extract_response_text(response)
+                results[i] = json.loads(response_text)
 
-            response = self.llm.invoke(messages)
-            response_text = extract_response_text(response)
-            result = json.loads(response_text)
-            return result
+            except Exception as e:
+                print(f"      ⚠️  Skills premium analysis failed: {e}")
+                results[i] = {"premium": 0.0, "reasoning": "Unable to assess"}
 
-        except Exception as e:
-            print(f"      ⚠️  Skills premium analysis failed: {e}")
-            return {"premium": 0.0, "reasoning": "Unable to assess"}
+        return results
 
-    def _generate_salary_reasoning(
+    def _generate_salary_reasonings(
         self,
-        candidate_profile: dict,
+        candidate_profiles: list[dict],
         job_requirements: dict,
-        experience_level: str,
-        adjusted_range: dict,
-        multipliers: dict,
-    ) -> str:
-        """Generate explanation for salary estimate using LLM"""
-
-        prompt = SALARY_ESTIMATE_EXPLANATION_PROMPT.format(
-            candidate_name=candidate_profile.get("name", "Candidate"),
-            job_title=job_requirements.get("job_title", "Role"),
-            experience_level=experience_level,
-            years_of_experience=candidate_profile.get(
-                "total_experience_years", "Unknown"
-            ),
-            location=candidate_profile.get("location", "Not specified"),
-            salary_min=f"{adjusted_range['min']:,}",
-            salary_max=f"{adjusted_range['max']:,}",
-            salary_median=f"{adjusted_range['median']:,}",
-            location_multiplier=f"{multipliers['location']:.2f}",
-            industry_multiplier=f"{multipliers['industry']:.2f}",
-            skills_premium=f"{multipliers['skills'] * 100:.0f}",
-        )
-
-        try:
-            messages = [
-                SystemMessage(
-                    content="You are a compensation analyst explaining salary estimates."
+        estimates: list[dict],
+    ) -> list[str]:
+        """Generate explanations for salary estimates using LLM"""
+
+        batch = []
+        for candidate_profile, estimate in zip(candidate_profiles, estimates):
+            adjusted_range = estimate["adjusted_range"]
+            factors = estimate["factors"]
+
+            prompt = SALARY_ESTIMATE_EXPLANATION_PROMPT.format(
+                candidate_name=candidate_profile.get("name", "Candidate"),
+                job_title=job_requirements.get("job_title", "Role"),
+                experience_level=factors["experience_level"],
+                years_of_experience=candidate_profile.get(
+                    "total_experience_years", "Unknown"
                 ),
-                HumanMessage(content=prompt),
-            ]
-
-            response = self.llm.invoke(messages)
-            return response.content.strip()
-
-        except Exception as e:
-            print(f"      ⚠️  Salary reasoning generation failed: {e}")
-            return f"Estimated salary range of ${adjusted_range['min']:,} - ${adjusted_range['max']:,} based on {experience_level} level with {candidate_profile.get('total_experience_years', 0)} years experience."
+                location=candidate_profile.get("location", "Not specified"),
+                salary_min=f"{adjusted_range['min']:,}",
+                salary_max=f"{adjusted_range['max']:,}",
+                salary_median=f"{adjusted_range['median']:,}",
+                location_multiplier=f"{factors['location_multiplier']:.2f}",
+                industry_multiplier=f"{factors['industry_multiplier']:.2f}",
+                skills_premium=f"{factors['skills_premium'] * 100:.0f}",
+            )
+
+            batch.append(
+                [
+                    SystemMessage(
+                        content="You are a compensation analyst explaining salary estimates."
+                    ),
+                    HumanMessage(content=prompt),
+                ]
+            )
+
+        responses = self.llm.batch(batch, return_exceptions=True) if batch else []
+
+        reasonings = []
+        for candidate_profile, estimate, response in zip(
+            candidate_profiles, estimates, responses
+        ):
+            if not isinstance(response, Exception):
+                reasonings.append(response.content.strip())
+                continue
+
+            print(f"      ⚠️  Salary reasoning generation failed: {response}")
+            adjusted_range = estimate["adjusted_range"]
+            experience_level = estimate["factors"]["experience_level"]
+            reasonings.append(
+                f"Estimated salary range of ${adjusted_range['min']:,} - ${adjusted_range['max']:,} based on {experience_level} level with {candidate_profile.get('total_experience_years', 0)} years experience."
+            )
+
+        return reasonings
 
     def _calculate_confidence(self, candidate_profile: dict) -> float:
         """Calculate confidence in salary estimate"""
@@ -10,6 +10,7 @@ from fuzzywuzzy import fuzz
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.llm.groq_llm import GroqLLM
+from src.llm.llm_cache import get_llm_result_cache
 from src.utils.utils import extract_response_text
 
 
@@ -26,6 +27,9 @@ class SkillTaxonomy:
     def __init__(self):
         self.llm = GroqLLM().get_llm_model()
 
+        # Similarity for identical skill pairs is reused across runs
+        self.result_cache = get_llm_result_cache()
+
         # Pre-defined skill relationships (fast lookup)
         self.equivalencies = {
             "tensorflow": ["pytorch", "keras"],
@@ -76,6 +80,22 @@ class SkillTaxonomy:
             ],
         }
 
+        # Skill -> hierarchy parents it appears under (as parent or child), so
+        # lookups only visit the relevant entries. Lists keep definition order.
+        self.skill_hierarchies = {}
+        for parent, children in self.hierarchies.items():
+            for skill in dict.fromkeys([parent, *children]):
+                self.skill_hierarchies.setdefault(skill, []).append(parent)
+
+        # Skill -> categories it belongs to, so category checks are dict hits
+        self.skill_categories = {}
+        for category, skills in self.categories.items():
+            for skill in skills:
+                self.skill_categories.setdefault(skill, []).append(category)
+
+        # Semantic similarity per normalized skill pair, shared across candidates
+        self.similarity_cache = {}
+
     def are_skills_equivalent(
         self, skill1: str, skill2: str, threshold: float = 0.7
     ) -> tuple[bool, float, str]:
@@ -107,13 +127,18 @@ class SkillTaxonomy:
             return True, fuzzy_score, f"Very similar naming: {skill1} ≈ {skill2}"
 
         # Check if they're in same category
-        for category, skills in self.categories.items():
-            if skill1_lower in skills and skill2_lower in skills:
-                return True, 0.7, f"Both are {category.replace('_', ' ')}"
+        categories1 = self.skill_categories.get(skill1_lower, [])
+        shared = set(categories1).intersection(
+            self.skill_categories.get(skill2_lower, [])
+        )
+        if shared:
+            # Report the first shared category in definition order
+            category = next(c for c in categories1 if c in shared)
+            return True, 0.7, f"Both are {category.replace('_', ' ')}"
 
         # Use LLM for semantic similarity (slower but more accurate)
         if threshold > 0.6:  # Only use LLM for closer matches
-            semantic_result = self._llm_skill_similarity(skill1, skill2)
+            semantic_result = self._semantic_similarity(skill1, skill2)
             if semantic_result["score"] >= threshold:
                 return True, semantic_result["score"], semantic_result["reasoning"]
 
@@ -140,7 +165,8 @@ class SkillTaxonomy:
                 )
 
         # Check hierarchies (parent/child)
-        for parent, children in self.hierarchies.items():
+        for parent in self.skill_hierarchies.get(skill_lower, []):
+            children = self.hierarchies[parent]
             if skill_lower == parent:
                 for child in children[:max_results]:
                     related.append(
@@ -160,17 +186,16 @@ class SkillTaxonomy:
                 )
 
         # Find same-category skills
-        for category, skills in self.categories.items():
-            if skill_lower in skills:
-                for s in skills:
-                    if s != skill_lower and len(related) < max_results:
-                        related.append(
-                            {
-                                "skill": s.title(),
-                                "relationship": "same_category",
-                                "score": 0.6,
-                            }
-                        )
+        for category in self.skill_categories.get(skill_lower, []):
+            for s in self.categories[category]:
+                if s != skill_lower and len(related) < max_results:
+                    related.append(
+                        {
+                            "skill": s.title(),
+                            "relationship": "same_category",
+                            "score": 0.6,
+                        }
+                    )
 
         return related[:max_results]
 
@@ -228,6 +253,21 @@ class SkillTaxonomy:
             "reasoning": reasoning,
         }
 
+    def _semantic_similarity(self, skill1: str, skill2: str) -> dict:
+        """
+        LLM similarity for a skill pair, asked once per pair
+
+        The same required skill is compared against the same candidate
+        skills for many candidates, so results are kept per normalized,
+        unordered pair.
+        """
+        key = tuple(sorted((skill1.lower().strip(), skill2.lower().strip())))
+
+        if key not in self.similarity_cache:
+            self.similarity_cache[key] = self._llm_skill_similarity(skill1, skill2)
+
+        return self.similarity_cache[key]
+
     def _llm_skill_similarity(self, skill1: str, skill2: str):
         """Use LLM to assess semantic similarity between skills"""
 
@@ -258,34 +298,36 @@ class SkillTaxonomy:
                 HumanMessage(content=prompt),
             ]
 
-            response = self.llm.invoke(messages)
-            response_text = extract_response_text(response)
-
-            # If response is empty, return default
-            if not response_text:
-                print(f" Empty LLM response for {skill1} vs {skill2}")
-                return {"score": 0.0, "reasoning": "Empty response from LLM"}
-
-            # Try to parse JSON
-            result = json.loads(response_text)
-
-            # Validate structure
-            if "score" not in result or "reasoning" not in result:
-                print(f" Invalid JSON structure for {skill1} vs {skill2}")
-                return {"score": 0.0, "reasoning": "Invalid response structure"}
-
+            result = self.result_cache.batch_invoke(
+                self.llm, "skill_similarity", [messages], self._parse_similarity
+            )[0]
+            if isinstance(result, Exception):
+                raise result
             return result
 
         except json.JSONDecodeError as e:
             print(f" JSON parse error for {skill1} vs {skill2}: {e}")
-            print(
-                f"    Response was: {response_text[:200] if 'response_text' in locals() else 'No response'}"
-            )
             return {"score": 0.0, "reasoning": "Unable to parse LLM response"}
+        except ValueError as e:
+            print(f" {e} for {skill1} vs {skill2}")
+            return {"score": 0.0, "reasoning": str(e)}
         except Exception as e:
             print(f" LLM similarity check failed for {skill1} vs {skill2}: {e}")
             return {"score": 0.0, "reasoning": "Unable to assess"}
 
+    def _parse_similarity(self, response) -> dict:
+        """Parse the LLM similarity reply (raises if unusable)"""
+        response_text = extract_response_text(response)
+        if not response_text:
+            raise ValueError("Empty response from LLM")
+
+        result = json.loads(response_text)
+
+        # Validate structure
+        if "score" not in result or "reasoning" not in result:
+            raise ValueError("Invalid response structure")
+        return result
+
 
 # Test
 if __name__ == "__main__":
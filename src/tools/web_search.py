@@ -4,6 +4,7 @@ Web Search Tool for Company Verification
 Uses DuckDuckGo to verify companies and gather tech stack information.
 """
 
+import asyncio
 import time
 
 from duckduckgo_search import DDGS
@@ -15,6 +16,7 @@ class WebSearchTool:
     def __init__(self):
         self.ddgs = DDGS()
         self.cache = {}  # Simple in-memory cache
+        self.rate_limit_seconds = 1.0  # Delay after each search request
 
     def search_company(self, company_name: str, max_results: int = 3) -> dict:
         """
@@ -33,12 +35,42 @@ class WebSearchTool:
                 "sources": List[str]
             }
         """
-        # Check cache
-        cache_key = f"company:{company_name.lower()}"
-        if cache_key in self.cache:
+        cached = self._cached_company(company_name)
+        if cached is not None:
+            return cached
+
+        result = self._fetch_company(company_name, max_results)
+
+        time.sleep(self.rate_limit_seconds)  # Rate limiting
+        return result
+
+    async def asearch_company(self, company_name: str, max_results: int = 3) -> dict:
+        """
+        Async variant of search_company
+
+        DDGS is a blocking client, so the search runs in a worker thread and
+        the rate-limit delay is awaited instead of slept. The client is shared
+        and not thread-safe, so callers must not run several of these at once
+        (CandidateEnricher puts them behind a semaphore).
+        """
+        cached = self._cached_company(company_name)
+        if cached is not None:
+            return cached
+
+        result = await asyncio.to_thread(self._fetch_company, company_name, max_results)
+
+        await asyncio.sleep(self.rate_limit_seconds)  # Rate limiting
+        return result
+
+    def _cached_company(self, company_name: str) -> dict | None:
+        """Return the cached search result for a company, if any"""
+        cached = self.cache.get(f"company:{company_name.lower()}")
+        if cached is not None:
             print(f"    📋 Using cached data for {company_name}")
-            return self.cache[cache_key]
+        return cached
 
+    def _fetch_company(self, company_name: str, max_results: int) -> dict:
+        """Run the company search against DuckDuckGo and cache the result"""
         print(f"    🔍 Searching web for: {company_name}")
 
         try:
@@ -104,9 +136,8 @@ class WebSearchTool:
             }
 
             # Cache result
-            self.cache[cache_key] = result
+            self.cache[f"company:{company_name.lower()}"] = result
 
-            time.sleep(1)  # Rate limiting
             return result
 
         except Exception as e: